@@ -0,0 +1,61 @@
+"""Task list/due-today indexes and the status CHECK constraint
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+
+- (status, due_date) and (assignee_id, status, due_date) back the list_tasks filter combinations.
+- The partial due_date index (due_date IS NOT NULL) backs get_due_today and due_before.
+- ix_tasks_assignee_status, created by create_all on some deployments, is superseded by
+  ix_tasks_assignee_status_due and dropped.
+- ck_tasks_status restricts status to todo/in_progress/done.
+
+Indexes are built CONCURRENTLY so existing tables keep taking writes; the constraint is added
+NOT VALID and validated separately for the same reason. Everything is IF [NOT] EXISTS / checked
+first, since create_all may already have created some of it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_assignee_status")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_status_due ON tasks (status, due_date)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_assignee_status_due "
+            "ON tasks (assignee_id, status, due_date)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_due_date_partial "
+            "ON tasks (due_date) WHERE due_date IS NOT NULL"
+        )
+    existing = {c["name"] for c in sa.inspect(op.get_bind()).get_check_constraints("tasks")}
+    if "ck_tasks_status" not in existing:
+        op.execute(
+            "ALTER TABLE tasks ADD CONSTRAINT ck_tasks_status "
+            "CHECK (status IN ('todo', 'in_progress', 'done')) NOT VALID"
+        )
+        op.execute("ALTER TABLE tasks VALIDATE CONSTRAINT ck_tasks_status")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("ck_tasks_status", "tasks", type_="check")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_due_date_partial")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_assignee_status_due")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_status_due")
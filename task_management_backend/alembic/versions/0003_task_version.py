@@ -0,0 +1,30 @@
+"""Add tasks.version (row version for task ETags)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+
+Existing rows start at version 1; the application bumps it on every UPDATE.
+Adding a column with a constant default is a catalog-only change on PostgreSQL 11+.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tasks", sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tasks", "version")
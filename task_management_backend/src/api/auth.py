@@ -9,18 +9,115 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 # All in-memory user storage is removed. DB session is required for all endpoints.
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from src.api.db import User
 from sqlalchemy.exc import IntegrityError
 
 import hashlib
+import hmac
+import os
+import time
 
-def hash_password(password: str) -> str:
-    # For demonstration only; use a secure hash + salt (e.g. Argon2/bcrypt) in real apps!
-    return hashlib.sha256(password.encode()).hexdigest()
+import anyio
+import jwt
+from cachetools import TTLCache
 
-def verify_password(plain_password: str, hashed: str) -> bool:
-    return hash_password(plain_password) == hashed
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# Argon2id with OWASP's recommended minimum parameters (46 MiB, t=3, p=1).
+# Hashes are stored in PHC string format, e.g. "$argon2id$v=19$m=47104,t=3,p=1$...".
+PH = PasswordHasher(time_cost=3, memory_cost=46 * 1024, parallelism=1)
+
+# Hot helpers bind their globals as default arguments so each call uses fast local lookups.
+# (Not applied to endpoints: FastAPI would expose extra parameters as query params.)
+def hash_password(password: str, _ph_hash=PH.hash) -> str:
+    return _ph_hash(password)
+
+def verify_password(plain_password: str, hashed: str, _ph_verify=PH.verify) -> bool:
+    if not hashed.startswith("$argon2"):
+        # Legacy unsalted SHA-256 hex digest; upgraded to Argon2id on next successful login.
+        legacy = hashlib.sha256(plain_password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, hashed)
+    try:
+        return _ph_verify(hashed, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def password_needs_rehash(hashed: str) -> bool:
+    if not hashed.startswith("$argon2"):
+        return True
+    return PH.check_needs_rehash(hashed)
+
+# Argon2 is CPU-bound for tens of milliseconds; run it in worker threads so concurrent requests
+# keep progressing on the event loop. A dedicated limiter caps in-flight hashes at the core count:
+# more adds no throughput, each holds ~46 MiB, and the default threadpool stays free for FastAPI's
+# sync dependencies.
+_HASH_LIMITER = anyio.CapacityLimiter(os.cpu_count() or 1)
+
+async def _hash(password: str) -> str:
+    return await anyio.to_thread.run_sync(hash_password, password, limiter=_HASH_LIMITER)
+
+async def _verify(plain_password: str, hashed: str) -> bool:
+    return await anyio.to_thread.run_sync(verify_password, plain_password, hashed, limiter=_HASH_LIMITER)
+
+# Access tokens are HS256 JWTs signed with JWT_SECRET (loaded from .env by src.api.db).
+JWT_SECRET = os.getenv("JWT_SECRET")
+
+if not JWT_SECRET:
+    raise RuntimeError("JWT_SECRET environment variable is not set.")
+# HS256 keys shorter than the 256-bit hash output are guessable/brute-forceable (RFC 7518 3.2).
+JWT_SECRET_MIN_BYTES = 32
+if len(JWT_SECRET.encode()) < JWT_SECRET_MIN_BYTES:
+    raise RuntimeError(f"JWT_SECRET must be at least {JWT_SECRET_MIN_BYTES} bytes; use a long random value.")
+
+JWT_ALGORITHM = "HS256"
+ACCESS_TOKEN_TTL = 60 * 60  # seconds
+
+# Verified token -> claims. Entries are also checked against their own "exp" on every hit,
+# so an expired token is never served from the cache.
+_token_cache: "TTLCache[str, dict]" = TTLCache(maxsize=100_000, ttl=60)
+
+def create_access_token(user_id: int) -> str:
+    now = int(time.time())
+    claims = {"sub": str(user_id), "iat": now, "exp": now + ACCESS_TOKEN_TTL}
+    return jwt.encode(claims, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+def decode_access_token(token: str, _cache=_token_cache, _now=time.time) -> dict:
+    """Verify a JWT and return its claims, reusing recent verifications. Raises 401 if invalid."""
+    claims = _cache.get(token)
+    if claims is None:
+        try:
+            claims = jwt.decode(
+                token, JWT_SECRET, algorithms=[JWT_ALGORITHM], options={"require": ["exp", "sub"]}
+            )
+        except jwt.InvalidTokenError:
+            raise HTTPException(status_code=401, detail="Invalid/missing token")
+        _cache[token] = claims
+    elif claims["exp"] <= _now():
+        _cache.pop(token, None)
+        raise HTTPException(status_code=401, detail="Invalid/missing token")
+    return claims
+
+def _user_id_from_claims(claims: dict) -> int:
+    try:
+        return int(claims["sub"])
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Malformed token")
+
+# PUBLIC_INTERFACE
+async def get_current_user_id(token: Optional[str] = None) -> int:
+    """Dependency: the user id from the `token` query parameter (a JWT from /auth/login). Raises 401 if invalid."""
+    # async on purpose: a sync dependency would run in the threadpool and touch _token_cache
+    # (not thread-safe) off the event-loop thread.
+    if not token:
+        raise HTTPException(status_code=401, detail="Invalid/missing token")
+    return _user_id_from_claims(decode_access_token(token))
+
+# Short-lived token -> UserRead cache so /auth/me skips the DB on repeat calls.
+# No lock needed: each get/set runs to completion on the single event-loop thread, and two
+# requests that miss concurrently (get_me awaits the DB in between) just fill the same entry twice.
+_me_cache: "TTLCache[str, UserRead]" = TTLCache(maxsize=10_000, ttl=15)
 
 # PUBLIC_INTERFACE
 @router.post(
@@ -37,28 +134,25 @@ async def signup(
     """
     Create a new user account. Checks uniqueness, hashes password.
     """
-    result = await db.execute(select(User).where(User.email == user_in.email))
-    if result.scalar_one_or_none():
+    # Existence probe only; resolved from the unique email index without loading the row.
+    # The unique constraint (IntegrityError below) remains the guard against races.
+    if await db.scalar(select(exists().where(User.email == user_in.email))):
         raise HTTPException(status_code=400, detail="Email already registered.")
     new_user = User(
         email=user_in.email,
         full_name=user_in.full_name,
-        hashed_password=hash_password(user_in.password),
+        hashed_password=await _hash(user_in.password),
         is_active=True,
     )
     db.add(new_user)
     try:
+        # No refresh needed: the INSERT returns the generated id, every other column is set
+        # client-side, and the session factory uses expire_on_commit=False.
         await db.commit()
-        await db.refresh(new_user)
     except IntegrityError:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Email already in use.")
-    return UserRead(
-        id=new_user.id,
-        email=new_user.email,
-        full_name=new_user.full_name,
-        is_active=new_user.is_active
-    )
+    return UserRead.model_validate(new_user)
 
 # PUBLIC_INTERFACE
 @router.post(
@@ -72,14 +166,20 @@ async def login(
     db: AsyncSession = Depends(get_db_session),
 ):
     """
-    User login to receive a (FAKE) bearer token after authenticating with the DB.
+    User login to receive a JWT bearer token after authenticating with the DB.
     """
     result = await db.execute(select(User).where(User.email == login_in.email))
     user = result.scalar_one_or_none()
-    if not user or not verify_password(login_in.password, user.hashed_password):
+    if not user or not await _verify(login_in.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials.")
-    # Real token logic would be here (JWT, OAuth, etc.)
-    return TokenResponse(access_token=f"fake-token-for-user-{user.id}", token_type="bearer")
+    if password_needs_rehash(user.hashed_password):
+        # Transparently upgrade legacy SHA-256 (or outdated Argon2 parameters) on successful auth.
+        user.hashed_password = await _hash(login_in.password)
+        try:
+            await db.commit()
+        except Exception:
+            await db.rollback()
+    return TokenResponse(access_token=create_access_token(user.id), token_type="bearer")
 
 # PUBLIC_INTERFACE
 @router.get(
@@ -93,22 +193,17 @@ async def get_me(
     db: AsyncSession = Depends(get_db_session),
 ):
     """
-    Retrieves info for the current user from token (FAKE token logic).
-    In real world, parse the JWT token for ID. Here, use the fake pattern 'fake-token-for-user-{id}'
+    Retrieves info for the current user from the JWT access token issued by /auth/login.
     """
-    if not token or not token.startswith("fake-token-for-user-"):
+    if not token:
         raise HTTPException(status_code=401, detail="Invalid/missing token")
-    try:
-        user_id = int(token.replace("fake-token-for-user-", "").split(":")[0])
-    except Exception:
-        raise HTTPException(status_code=401, detail="Malformed token")
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    claims = decode_access_token(token)
+    cached = _me_cache.get(token)
+    if cached is not None:
+        return cached
+    user = await db.get(User, _user_id_from_claims(claims))
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
-    return UserRead(
-        id=user.id,
-        email=user.email,
-        full_name=user.full_name,
-        is_active=user.is_active
-    )
+    user_read = UserRead.model_validate(user)
+    _me_cache[token] = user_read
+    return user_read
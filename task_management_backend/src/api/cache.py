@@ -0,0 +1,118 @@
+import os
+from typing import Optional
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from dotenv import load_dotenv
+
+# Load environment variables from .env if present
+load_dotenv()
+
+# Shared response cache for read-heavy endpoints (e.g. redis://localhost:6379/0).
+# Optional: when REDIS_URL is unset, caching is disabled and every read goes to Postgres.
+# The cache is best effort; Redis errors are treated as cache misses.
+#
+# Layout: one Redis hash per namespace ("tasks:list", ...), one field per cache key. Mutations
+# invalidate a whole namespace with a single DEL, and each hash expires CACHE_TTL seconds after
+# it was first filled (EXPIRE ... NX, Redis >= 7), bounding how stale any entry can get.
+REDIS_URL = os.getenv('REDIS_URL')
+CACHE_TTL = 60  # seconds
+# A Redis that hangs rather than refusing connections must not stall requests: past these
+# limits the call raises redis TimeoutError (a RedisError), which is handled as a cache miss.
+CACHE_SOCKET_TIMEOUT = 0.05  # seconds
+CACHE_CONNECT_TIMEOUT = 0.05  # seconds
+
+_redis = redis.from_url(
+    REDIS_URL,
+    socket_timeout=CACHE_SOCKET_TIMEOUT,
+    socket_connect_timeout=CACHE_CONNECT_TIMEOUT,
+) if REDIS_URL else None
+
+
+# PUBLIC_INTERFACE
+async def cache_get(namespace: str, key: str) -> Optional[bytes]:
+    """Return the cached bytes for `key` in `namespace`, or None on a miss (or if caching is off)."""
+    if _redis is None:
+        return None
+    try:
+        return await _redis.hget(namespace, key)
+    except RedisError:
+        return None
+
+# PUBLIC_INTERFACE
+async def cache_set(namespace: str, key: str, value: bytes, ttl: int = CACHE_TTL):
+    """Store `value` under `key` in `namespace`; the namespace expires `ttl` seconds after first fill."""
+    if _redis is None:
+        return
+    try:
+        async with _redis.pipeline(transaction=False) as pipe:
+            pipe.hset(namespace, key, value)
+            pipe.expire(namespace, ttl, nx=True)
+            await pipe.execute()
+    except RedisError:
+        pass
+
+# Store "<version> <value>" only if no entry with an equal or newer version is present, so
+# write-throughs that finish out of order cannot put an older value back.
+_SET_IF_NEWER = """
+local current = redis.call('HGET', KEYS[1], ARGV[1])
+if current then
+    local stored = tonumber(string.match(current, '^(%d+) '))
+    if stored and stored >= tonumber(ARGV[2]) then
+        return 0
+    end
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2] .. ' ' .. ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4], 'NX')
+return 1
+"""
+
+# PUBLIC_INTERFACE
+async def cache_get_versioned(namespace: str, key: str) -> Optional[bytes]:
+    """Return the value stored by cache_set_if_newer for `key` in `namespace`, or None on a miss."""
+    entry = await cache_get(namespace, key)
+    if entry is None:
+        return None
+    return entry.partition(b" ")[2]
+
+# PUBLIC_INTERFACE
+async def cache_set_if_newer(
+    namespace: str, key: str, value: bytes, version: int, ttl: int = CACHE_TTL
+) -> bool:
+    """
+    Store `value` under `key` unless the cached entry already has a version >= `version` (an int).
+    Returns False only if Redis could not be written, in which case any existing entry may be stale.
+    """
+    if _redis is None:
+        return True
+    try:
+        await _redis.eval(_SET_IF_NEWER, 1, namespace, key, version, value, ttl)
+    except RedisError:
+        return False
+    return True
+
+# PUBLIC_INTERFACE
+async def cache_delete(namespace: str, key: str):
+    """Drop a single entry from `namespace`."""
+    if _redis is None:
+        return
+    try:
+        await _redis.hdel(namespace, key)
+    except RedisError:
+        pass
+
+# PUBLIC_INTERFACE
+async def cache_invalidate(*namespaces: str):
+    """Drop every entry in the given namespaces (call after a successful write)."""
+    if _redis is None or not namespaces:
+        return
+    try:
+        await _redis.delete(*namespaces)
+    except RedisError:
+        pass
+
+# PUBLIC_INTERFACE
+async def close_cache():
+    """Close the Redis connection pool (app shutdown)."""
+    if _redis is not None:
+        await _redis.aclose()
@@ -1,7 +1,13 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api.auth import router as auth_router
+from src.api.db import engine, warm_pool
+from src.api.cache import close_cache
 from src.api.task import router as task_router
 
 openapi_tags = [
@@ -9,19 +15,45 @@ openapi_tags = [
     {"name": "Tasks", "description": "Endpoints for creating, updating, deleting, and organizing tasks."}
 ]
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    # Schema changes are not applied here: run `alembic upgrade head` once per deploy, before
+    # starting the (possibly multi-worker) server.
+    await warm_pool()
+    yield
+    await close_cache()
+    await engine.dispose()
+
+
 app = FastAPI(
     title="Task Management Backend API",
     description="Backend API for a fullstack task management application. Provides REST endpoints for authentication, task management, status change, assignment, and more.",
     version="0.1.0",
     openapi_tags=openapi_tags,
+    lifespan=lifespan,
+    # orjson encodes responses several times faster than the stdlib json module.
+    default_response_class=ORJSONResponse,
 )
 
+# Comma-separated list of browser origins allowed to call the API (e.g. the frontend URL).
+# Explicit origins avoid reflecting arbitrary Origin headers alongside credentials.
+FRONTEND_ORIGIN = os.getenv("FRONTEND_ORIGIN")
+
+if not FRONTEND_ORIGIN:
+    raise RuntimeError("FRONTEND_ORIGIN environment variable is not set.")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=[origin.strip() for origin in FRONTEND_ORIGIN.split(",") if origin.strip()],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["authorization", "content-type", "if-none-match"],
+    # Let the frontend read ETags for conditional GETs on task reads.
+    expose_headers=["ETag"],
+    # Let browsers cache preflight responses for 24h instead of re-sending OPTIONS.
+    max_age=86400,
 )
 
 @app.get("/", tags=["Health"])
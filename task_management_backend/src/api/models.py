@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional, List
 from datetime import datetime, date
 
@@ -20,6 +20,8 @@ class UserLogin(BaseModel):
 # PUBLIC_INTERFACE
 class UserRead(BaseModel):
     """Response schema for user data."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     email: EmailStr
     full_name: Optional[str] = None
@@ -47,6 +49,11 @@ class TaskCreate(TaskBase):
     """Schema for creating a new task."""
     assignee_id: Optional[int] = Field(None, description="ID of assigned user (optional for creation)")
 
+# PUBLIC_INTERFACE
+class TaskBulkCreate(BaseModel):
+    """Schema for creating several tasks in one request."""
+    tasks: List[TaskCreate] = Field(..., min_length=1, max_length=500, description="Tasks to create (1-500)")
+
 # PUBLIC_INTERFACE
 class TaskUpdate(BaseModel):
     """Schema for updating a task."""
@@ -58,7 +65,10 @@ class TaskUpdate(BaseModel):
 
 # PUBLIC_INTERFACE
 class TaskRead(TaskBase):
-    """Schema for returning a task."""
+    """
+    Schema of a returned task. Documents the responses (OpenAPI) and fixes their field order
+    (src.api.task._READ_FIELDS); task routes serialize rows directly and never instantiate it.
+    """
     id: int
     creator_id: int
     assignee_id: Optional[int] = None
@@ -67,9 +77,9 @@ class TaskRead(TaskBase):
 
 # PUBLIC_INTERFACE
 class TaskListResponse(BaseModel):
-    """Response schema for a list of tasks."""
+    """Response schema for a list of tasks (OpenAPI documentation only; never instantiated)."""
     tasks: List[TaskRead]
-    total: int
+    total: Optional[int] = Field(None, description="Number of matching tasks (null when not requested)")
 
 # PUBLIC_INTERFACE
 class MessageResponse(BaseModel):
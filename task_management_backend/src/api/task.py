@@ -1,14 +1,24 @@
-from fastapi import APIRouter, Query, status, Depends
-from typing import Optional
+from fastapi import APIRouter, Header, Query, Response, status, Depends
+from typing import List, Optional
 from datetime import date
+from email.utils import formatdate
+from operator import attrgetter
+import hashlib
+
+import orjson
 from src.api.models import (
     TaskCreate,
+    TaskBulkCreate,
     TaskUpdate,
     TaskRead,
     TaskListResponse,
     MessageResponse,
 )
 from src.api.db import get_db_session
+from src.api.auth import get_current_user_id
+from src.api.cache import (
+    cache_delete, cache_get, cache_get_versioned, cache_invalidate, cache_set, cache_set_if_newer
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
@@ -18,111 +28,340 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
 # Here, we just provide placeholder skeletons for DB session use.
 
 from fastapi import HTTPException
-from sqlalchemy import select, and_
+from sqlalchemy import (
+    Date, Integer, bindparam, cast, delete, exists, func, insert, lambda_stmt, literal_column, select,
+    text, update,
+)
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.exc import IntegrityError
-from src.api.db import Task, User
-from datetime import datetime
-
-def task_to_read(task: Task) -> TaskRead:
-    return TaskRead(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        due_date=task.due_date,
-        status=task.status,
-        creator_id=task.creator_id,
-        assignee_id=task.assignee_id,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-    )
+from src.api.db import TASK_STATUSES, Task, User
+
+_ALLOWED_STATUSES = frozenset(TASK_STATUSES)
+
+# Today's date in UTC, evaluated by Postgres (now() is stable, so the due_date index still applies).
+# Keeps the Python side free of per-request date work and immune to app/DB clock skew.
+_UTC_TODAY = cast(func.timezone(literal_column("'UTC'"), func.now()), Date)
+
+# TaskRead's field names, in schema order. Rows serialized by hand in this order produce the
+# same JSON as the schema, and both the ORM and Core read paths below are built from it.
+_READ_FIELDS = tuple(TaskRead.model_fields)
+_read_values = attrgetter(*_READ_FIELDS)
+
+def _task_json(task: Task) -> bytes:
+    # Serialize an ORM task (e.g. a RETURNING row) as TaskRead JSON without building a TaskRead:
+    # the routes returning this declare response_model=None, so FastAPI does not re-validate it.
+    return orjson.dumps(dict(zip(_READ_FIELDS, _read_values(task))), option=orjson.OPT_UTC_Z)
+
+# Column projection matching TaskRead. Read paths select these as plain Core rows, skipping ORM
+# hydration/identity-map bookkeeping and pydantic re-validation of DB data.
+_TASK_COLUMNS = tuple(getattr(Task, field) for field in _READ_FIELDS)
+
+# Prebuilt page of the unfiltered task list (the unfiltered total, if asked for, is an estimate,
+# so this never needs the window count).
+_UNFILTERED_PAGE = (
+    select(*_TASK_COLUMNS)
+    .order_by(Task.id)
+    .limit(bindparam("limit", type_=Integer))
+    .offset(bindparam("offset", type_=Integer))
+)
+
+_TASK_COUNT_ESTIMATE = text(
+    f"SELECT reltuples::bigint FROM pg_class WHERE oid = '{Task.__tablename__}'::regclass"
+)
+
+# Redis namespaces (see src.api.cache): cached list responses, which any task write drops, and
+# task id -> current ETag so get_task can answer a matching If-None-Match without Postgres. ETags
+# are written through by the mutation endpoints from their RETURNING rows, never by readers.
+_LIST_CACHE = "tasks:list"
+_DUE_TODAY_CACHE = "tasks:due_today"
+_ETAG_CACHE = "tasks:etag"
+
+# Postgres SQLSTATE for foreign_key_violation: creator/assignee id does not match a user.
+_FK_VIOLATION = "23503"
+
+def _integrity_error(exc: IntegrityError, detail: str) -> HTTPException:
+    if getattr(exc.orig, "pgcode", None) == _FK_VIOLATION:
+        return HTTPException(status_code=404, detail="User not found.")
+    return HTTPException(status_code=400, detail=detail)
+
+async def _invalidate_task_lists():
+    await cache_invalidate(_LIST_CACHE, _DUE_TODAY_CACHE)
+
+def _task_etag(task_id: int, version: int) -> str:
+    # Task.version is bumped by every UPDATE, so it versions the whole representation.
+    return f'W/"{task_id}-{version}"'
+
+async def _store_task_etag(task_id: int, version: int, deleted: bool = False):
+    # Write-through from a mutation's RETURNING row (a deleted task gets an empty tombstone).
+    # cache_set_if_newer keeps a slower writer from putting back an older tag. If the write fails,
+    # drop the field rather than leave the previous version's tag answering 304s.
+    etag = b"" if deleted else _task_etag(task_id, version).encode()
+    if not await cache_set_if_newer(_ETAG_CACHE, str(task_id), etag, version):
+        await cache_delete(_ETAG_CACHE, str(task_id))
+
+def _list_cache_key(
+    status: Optional[str],
+    assignee_id: Optional[int],
+    due_before: Optional[date],
+    limit: int,
+    offset: int,
+    include_total: bool,
+) -> str:
+    """
+    Redis field for one list_tasks parameter combination. JSON-encoded, so an absent filter (null)
+    never collides with a literal query value such as ?status=None.
+    """
+    return orjson.dumps([status, assignee_id, due_before, limit, offset, include_total]).decode()
+
+def _json_response(body: bytes, headers: Optional[dict] = None, status_code: int = 200) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # Weak comparison (RFC 9110 13.1.2): the header may list several tags, or be "*".
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = _opaque_tag(etag)
+    return any(_opaque_tag(tag.strip()) == opaque for tag in if_none_match.split(","))
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+async def _estimated_task_count(db: AsyncSession) -> int:
+    # Planner statistics (kept fresh by autovacuum/ANALYZE): O(1) instead of scanning all tasks.
+    estimate = await db.scalar(_TASK_COUNT_ESTIMATE)
+    if estimate is None or estimate < 0:
+        # Never analyzed yet (reltuples = -1): pay for an exact count once.
+        return await db.scalar(lambda_stmt(lambda: select(func.count()).select_from(Task)))
+    return estimate
+
+def _with_filters(stmt: StatementLambdaElement, filters: list) -> StatementLambdaElement:
+    for add_filter in filters:
+        stmt += add_filter
+    return stmt
+
+async def _fetch_task_page(
+    db: AsyncSession, filters: list, limit: int, offset: int, include_total: bool = True
+) -> bytes:
+    """
+    Return one page (ordered by id) of tasks matching `filters`, already serialized as
+    TaskListResponse JSON. With include_total, "total" is the exact match count, or the
+    planner's row estimate when there are no filters; otherwise it is null.
+
+    `filters` are lambda_stmt steps (`lambda s: s.where(...)`). Statements are assembled from
+    lambdas so SQLAlchemy caches each query shape after the first call; later calls only
+    extract the bound values instead of rebuilding and re-keying the whole construct.
+    """
+    if not filters:
+        # Bare list, the most-hit variant: nothing to build, only limit/offset are bound.
+        rows = (await db.execute(_UNFILTERED_PAGE, {"limit": limit, "offset": offset})).all()
+    else:
+        if include_total:
+            # count(*) OVER () returns the full match count alongside the page in one round-trip.
+            # Without it, the scan can stop as soon as LIMIT rows have been produced.
+            query = lambda_stmt(lambda: select(*_TASK_COLUMNS, func.count().over().label("total")))
+        else:
+            query = lambda_stmt(lambda: select(*_TASK_COLUMNS))
+        query = _with_filters(query, filters)
+        query += lambda s: s.order_by(Task.id).limit(limit).offset(offset)
+        rows = (await db.execute(query)).all()
+    total = None
+    if include_total:
+        if not filters:
+            # Never report fewer tasks than the page itself proves exist.
+            total = max(await _estimated_task_count(db), offset + len(rows))
+        elif rows:
+            total = rows[0].total
+        elif offset:
+            # Page past the end: no row carries the window count, so ask for it directly.
+            count_query = lambda_stmt(lambda: select(func.count()).select_from(Task))
+            total = await db.scalar(_with_filters(count_query, filters))
+        else:
+            total = 0
+    # Rows go straight to orjson as plain dicts, with no per-row pydantic model. zip() stops at
+    # the last task column, dropping the trailing "total". OPT_UTC_Z matches pydantic's "Z" suffix.
+    tasks = [dict(zip(_READ_FIELDS, row)) for row in rows]
+    return orjson.dumps({"tasks": tasks, "total": total}, option=orjson.OPT_UTC_Z)
+
+async def _update_task_returning(db: AsyncSession, stmt, error_detail: str) -> Task:
+    """
+    Run a single `UPDATE tasks ... RETURNING Task` (no prior SELECT, no refresh).
+    updated_at is bumped by the column's onupdate=func.now(). Raises 404 if the task does not exist.
+    """
+    try:
+        task = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=error_detail)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found.")
+    await _invalidate_task_lists()
+    await _store_task_etag(task.id, task.version)
+    return task
 
 # PUBLIC_INTERFACE
 @router.post(
     "/",
     summary="Create a new task",
-    response_model=TaskRead,
+    response_model=None,
+    responses={201: {"model": TaskRead}},
     status_code=status.HTTP_201_CREATED
 )
 async def create_task(
     task_in: TaskCreate,
+    creator_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
-    Create a new task, assign to assignee_id if provided, creator_id required for real apps.
-    Here, placeholder: use creator_id=1 for demonstration.
+    Create a new task owned by the authenticated user, assigned to assignee_id if provided.
     """
-    creator_id = 1  # For demo only; should be inferred from auth user!
-    new_task = Task(
+    # INSERT ... RETURNING hands back the DB-generated id/created_at/updated_at in the same
+    # round-trip, so there is no post-commit refresh and no client-side timestamp. The creator
+    # and assignee ids are checked by the FK constraints, not by separate lookups.
+    stmt = insert(Task).values(
         title=task_in.title,
         description=task_in.description,
         due_date=task_in.due_date,
         status=task_in.status or "todo",
         creator_id=creator_id,
         assignee_id=task_in.assignee_id,
-    )
-    db.add(new_task)
+    ).returning(Task)
     try:
+        new_task = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(new_task)
-    except IntegrityError:
+    except IntegrityError as exc:
         await db.rollback()
-        raise HTTPException(status_code=400, detail="Could not create task: integrity error.")
-    return task_to_read(new_task)
+        raise _integrity_error(exc, "Could not create task: integrity error.")
+    await _invalidate_task_lists()
+    await _store_task_etag(new_task.id, new_task.version)
+    return _json_response(_task_json(new_task), status_code=status.HTTP_201_CREATED)
+
+# PUBLIC_INTERFACE
+@router.post(
+    "/bulk",
+    summary="Create several tasks at once",
+    response_model=None,
+    responses={201: {"model": List[TaskRead]}},
+    status_code=status.HTTP_201_CREATED
+)
+async def create_tasks_bulk(
+    bulk_in: TaskBulkCreate,
+    creator_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Create up to 500 tasks owned by the authenticated user in a single statement and
+    transaction (all or nothing).
+    """
+    rows = [
+        {
+            "title": task_in.title,
+            "description": task_in.description,
+            "due_date": task_in.due_date,
+            "status": task_in.status or "todo",
+            "creator_id": creator_id,
+            "assignee_id": task_in.assignee_id,
+        }
+        for task_in in bulk_in.tasks
+    ]
+    # A list of parameter sets is sent as one batched INSERT ... RETURNING (insertmanyvalues),
+    # not one round-trip per task; rows come back in input order.
+    try:
+        new_tasks = (await db.scalars(insert(Task).returning(Task, sort_by_parameter_order=True), rows)).all()
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_error(exc, "Could not create tasks: integrity error.")
+    await _invalidate_task_lists()
+    body = b"[" + b",".join(_task_json(task) for task in new_tasks) + b"]"
+    return _json_response(body, status_code=status.HTTP_201_CREATED)
 
 # PUBLIC_INTERFACE
 @router.get(
     "/",
     summary="List tasks (all or filtered)",
-    response_model=TaskListResponse
+    # The handler returns pre-serialized JSON; the model only documents the response shape.
+    response_model=None,
+    responses={200: {"model": TaskListResponse}},
 )
 async def list_tasks(
     status: Optional[str] = Query(None, description="Filter by status"),
     assignee_id: Optional[int] = Query(None, description="Filter by assignee id"),
     due_before: Optional[date] = Query(None, description="Tasks due before this date"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of tasks to return"),
+    offset: int = Query(0, ge=0, description="Number of tasks to skip"),
+    include_total: bool = Query(
+        False, description="Also return total (exact when filtered, estimated when unfiltered)"
+    ),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
-    List all tasks with optional filtering: by status, assignee_id, due_before.
+    List tasks with optional filtering: by status, assignee_id, due_before.
+    Results are ordered by id and paginated with limit/offset. total is null unless include_total
+    is set, so the default page query never has to visit every matching row.
+    Responses are cached in Redis per parameter combination until the next task write.
     """
+    cache_key = _list_cache_key(status, assignee_id, due_before, limit, offset, include_total)
+    cached = await cache_get(_LIST_CACHE, cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
     filters = []
     if status:
-        filters.append(Task.status == status)
+        filters.append(lambda s: s.where(Task.status == status))
     if assignee_id is not None:
-        filters.append(Task.assignee_id == assignee_id)
+        filters.append(lambda s: s.where(Task.assignee_id == assignee_id))
     if due_before is not None:
-        filters.append(Task.due_date != None)
-        filters.append(Task.due_date <= due_before)
-    query = select(Task)
-    if filters:
-        query = query.where(and_(*filters))
-    result = await db.execute(query)
-    tasks = result.scalars().all()
-    return TaskListResponse(tasks=[task_to_read(t) for t in tasks], total=len(tasks))
+        # NULL due dates never satisfy the comparison, so no explicit IS NOT NULL is needed.
+        filters.append(lambda s: s.where(Task.due_date <= due_before))
+    body = await _fetch_task_page(db, filters, limit, offset, include_total)
+    await cache_set(_LIST_CACHE, cache_key, body)
+    return _json_response(body)
 
 # PUBLIC_INTERFACE
 @router.get(
     "/{task_id}",
     summary="Get task by id",
-    response_model=TaskRead
+    response_model=None,
+    responses={200: {"model": TaskRead}},
 )
 async def get_task(
     task_id: int,
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
     Get a single task by id.
+    Sends ETag/Last-Modified; a matching If-None-Match gets 304 Not Modified, straight from Redis
+    when the task's current ETag is cached there.
     """
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    if not task:
+    if if_none_match:
+        # An empty value is a delete_task tombstone: never a match, fall through to the 404.
+        cached_etag = await cache_get_versioned(_ETAG_CACHE, str(task_id))
+        if cached_etag and _etag_matches(if_none_match, cached_etag.decode()):
+            return _not_modified(cached_etag.decode())
+    # Same pipeline as the list endpoints: Core row -> dict -> orjson bytes, no TaskRead in between.
+    query = lambda_stmt(lambda: select(*_TASK_COLUMNS, Task.version).where(Task.id == task_id))
+    row = (await db.execute(query)).one_or_none()
+    if row is None:
         raise HTTPException(status_code=404, detail="Task not found.")
-    return task_to_read(task)
+    etag = _task_etag(task_id, row.version)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    headers = {"ETag": etag, "Last-Modified": formatdate(row.updated_at.timestamp(), usegmt=True)}
+    return _json_response(orjson.dumps(dict(zip(_READ_FIELDS, row)), option=orjson.OPT_UTC_Z), headers)
 
 # PUBLIC_INTERFACE
 @router.put(
     "/{task_id}",
     summary="Update a task",
-    response_model=TaskRead
+    response_model=None,
+    responses={200: {"model": TaskRead}},
 )
 async def update_task(
     task_id: int,
@@ -132,20 +371,17 @@ async def update_task(
     """
     Update task fields by id. Only updates provided fields.
     """
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found.")
-
-    for attr, value in task_in.model_dump(exclude_unset=True).items():
-        setattr(task, attr, value)
-    try:
-        await db.commit()
-        await db.refresh(task)
-    except Exception:
-        await db.rollback()
-        raise HTTPException(status_code=400, detail="Could not update task.")
-    return task_to_read(task)
+    values = task_in.model_dump(exclude_unset=True)
+    if not values:
+        task = await db.get(Task, task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found.")
+        return _json_response(_task_json(task))
+    # The SET list varies with the request body, so this one is built directly rather than as a
+    # lambda_stmt; SQLAlchemy's compiled cache still covers each column combination.
+    stmt = update(Task).where(Task.id == task_id).values(**values).returning(Task)
+    task = await _update_task_returning(db, stmt, "Could not update task.")
+    return _json_response(_task_json(task))
 
 # PUBLIC_INTERFACE
 @router.delete(
@@ -160,23 +396,27 @@ async def delete_task(
     """
     Delete a task by id.
     """
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    await db.delete(task)
+    stmt = delete(Task).where(Task.id == task_id).returning(Task.version)
     try:
+        version = (await db.execute(stmt)).scalar_one_or_none()
         await db.commit()
     except Exception:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Unable to delete task.")
+    if version is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    await _invalidate_task_lists()
+    # Tombstone one version past the deleted row, so a write-through from an update that committed
+    # before the delete but reaches Redis after it cannot bring the task's ETag back.
+    await _store_task_etag(task_id, version + 1, deleted=True)
     return MessageResponse(message="Task deleted.")
 
 # PUBLIC_INTERFACE
 @router.post(
     "/{task_id}/assign",
     summary="Assign task to a user",
-    response_model=TaskRead
+    response_model=None,
+    responses={200: {"model": TaskRead}},
 )
 async def assign_task(
     task_id: int,
@@ -186,31 +426,34 @@ async def assign_task(
     """
     Assign a task to the provided user ID.
     """
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found.")
-
-    # Validate assignee exists
-    user_result = await db.execute(select(User).where(User.id == assignee_id))
-    assignee = user_result.scalar_one_or_none()
-    if not assignee:
-        raise HTTPException(status_code=404, detail="Assignee user not found.")
-
-    task.assignee_id = assignee_id
+    # Assignee validation rides along in the UPDATE's WHERE clause: one round-trip on success.
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id, exists().where(User.id == assignee_id))
+        .values(assignee_id=assignee_id)
+        .returning(Task)
+    )
     try:
+        task = (await db.execute(stmt)).scalar_one_or_none()
         await db.commit()
-        await db.refresh(task)
     except Exception:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Failed to assign task.")
-    return task_to_read(task)
+    if task is None:
+        # Either the task or the assignee is missing; a PK probe on tasks tells which.
+        if await db.scalar(select(Task.id).where(Task.id == task_id)) is None:
+            raise HTTPException(status_code=404, detail="Task not found.")
+        raise HTTPException(status_code=404, detail="Assignee user not found.")
+    await _invalidate_task_lists()
+    await _store_task_etag(task.id, task.version)
+    return _json_response(_task_json(task))
 
 # PUBLIC_INTERFACE
 @router.post(
     "/{task_id}/status",
     summary="Update status of a task",
-    response_model=TaskRead
+    response_model=None,
+    responses={200: {"model": TaskRead}},
 )
 async def update_status(
     task_id: int,
@@ -220,36 +463,41 @@ async def update_status(
     """
     Update the status field (todo|in_progress|done) of a task.
     """
-    if new_status not in ("todo", "in_progress", "done"):
+    # Fail fast with a clear message; the ck_tasks_status CHECK constraint is the real guard.
+    if new_status not in _ALLOWED_STATUSES:
         raise HTTPException(status_code=400, detail="Invalid status value.")
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found.")
-    task.status = new_status
-    try:
-        await db.commit()
-        await db.refresh(task)
-    except Exception:
-        await db.rollback()
-        raise HTTPException(status_code=400, detail="Failed to update status.")
-    return task_to_read(task)
+    stmt = lambda_stmt(
+        lambda: update(Task).where(Task.id == task_id).values(status=new_status).returning(Task)
+    )
+    task = await _update_task_returning(db, stmt, "Failed to update status.")
+    return _json_response(_task_json(task))
 
 # PUBLIC_INTERFACE
 @router.get(
     "/due/today",
     summary="Get tasks due today",
-    response_model=TaskListResponse
+    response_model=None,
+    responses={200: {"model": TaskListResponse}},
 )
 async def get_due_today(
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of tasks to return"),
+    offset: int = Query(0, ge=0, description="Number of tasks to skip"),
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
-    Return a list of tasks due today.
+    Return tasks due today (UTC), ordered by id and paginated with limit/offset.
+    Cached in Redis until the next task write. Sends an ETag of the body; a matching
+    If-None-Match gets 304 Not Modified.
     """
-    today = datetime.utcnow().date()
-    result = await db.execute(
-        select(Task).where(Task.due_date == today)
-    )
-    tasks = result.scalars().all()
-    return TaskListResponse(tasks=[task_to_read(t) for t in tasks], total=len(tasks))
+    # The date is not part of the key: the namespace expires within CACHE_TTL of midnight anyway.
+    cache_key = f"{limit}|{offset}"
+    body = await cache_get(_DUE_TODAY_CACHE, cache_key)
+    if body is None:
+        body = await _fetch_task_page(db, [lambda s: s.where(Task.due_date == _UTC_TODAY)], limit, offset)
+        await cache_set(_DUE_TODAY_CACHE, cache_key, body)
+    # A page has no single version column, so the tag is a digest of the (deterministic) body.
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    return _json_response(body, {"ETag": etag})
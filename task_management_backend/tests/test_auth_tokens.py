@@ -0,0 +1,35 @@
+import time
+
+import pytest
+from cachetools import TTLCache
+from fastapi import HTTPException
+
+from src.api.auth import create_access_token, decode_access_token
+
+
+def test_decode_caches_verified_claims():
+    cache = TTLCache(maxsize=10, ttl=60)
+    token = create_access_token(7)
+    claims = decode_access_token(token, _cache=cache)
+    assert claims["sub"] == "7"
+    assert cache[token] is claims
+    assert decode_access_token(token, _cache=cache) is claims
+
+
+def test_decode_rejects_token_that_expired_while_cached():
+    cache = TTLCache(maxsize=10, ttl=60)
+    token = create_access_token(7)
+    claims = decode_access_token(token, _cache=cache)
+    with pytest.raises(HTTPException) as exc_info:
+        decode_access_token(token, _cache=cache, _now=lambda: claims["exp"] + 1)
+    assert exc_info.value.status_code == 401
+    # The expired entry is evicted rather than served again.
+    assert token not in cache
+
+
+def test_decode_rejects_invalid_token_without_caching_it():
+    cache = TTLCache(maxsize=10, ttl=60)
+    with pytest.raises(HTTPException) as exc_info:
+        decode_access_token("not-a-jwt", _cache=cache, _now=time.time)
+    assert exc_info.value.status_code == 401
+    assert "not-a-jwt" not in cache
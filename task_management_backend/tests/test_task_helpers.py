@@ -0,0 +1,36 @@
+from datetime import date
+
+from src.api.task import _etag_matches, _list_cache_key
+
+
+def test_list_cache_key_keeps_missing_filter_and_literal_none_apart():
+    # ?status=None must not share a cached page with "no status filter".
+    assert _list_cache_key(None, None, None, 50, 0, False) != _list_cache_key("None", None, None, 50, 0, False)
+    assert _list_cache_key(None, None, None, 50, 0, False) != _list_cache_key(None, None, None, 50, 0, True)
+
+
+def test_list_cache_key_is_stable_per_combination():
+    key = _list_cache_key("todo", 3, date(2026, 1, 2), 20, 40, True)
+    assert key == _list_cache_key("todo", 3, date(2026, 1, 2), 20, 40, True)
+    assert key != _list_cache_key("todo", 3, date(2026, 1, 3), 20, 40, True)
+    # The separator cannot be smuggled in through a filter value.
+    assert _list_cache_key("a|1", None, None, 50, 0, False) != _list_cache_key("a", 1, None, 50, 0, False)
+
+
+def test_etag_matches_uses_weak_comparison():
+    assert _etag_matches('W/"1-2"', 'W/"1-2"')
+    assert _etag_matches('"1-2"', 'W/"1-2"')
+    assert _etag_matches('W/"1-2"', '"1-2"')
+    assert not _etag_matches('W/"1-1"', 'W/"1-2"')
+
+
+def test_etag_matches_any_tag_in_a_list():
+    assert _etag_matches('W/"a", W/"1-2" , "b"', 'W/"1-2"')
+    assert not _etag_matches('W/"a", "b"', 'W/"1-2"')
+
+
+def test_etag_matches_star_and_missing_header():
+    assert _etag_matches("*", 'W/"1-2"')
+    assert _etag_matches(" * ", 'W/"1-2"')
+    assert not _etag_matches(None, 'W/"1-2"')
+    assert not _etag_matches("", 'W/"1-2"')
@@ -0,0 +1,95 @@
+from collections import namedtuple
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+
+from src.api.db import Task
+from src.api.task import _READ_FIELDS, _fetch_task_page
+
+pytestmark = pytest.mark.anyio
+
+TaskRow = namedtuple("TaskRow", _READ_FIELDS)
+CountedRow = namedtuple("CountedRow", _READ_FIELDS + ("total",))
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _values(task_id):
+    return ("t%d" % task_id, None, None, "todo", task_id, 1, None, NOW, NOW)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    """Stands in for AsyncSession: execute() returns the page rows, scalar() pops scripted values."""
+
+    def __init__(self, rows, scalars=()):
+        self.rows = rows
+        self.scalars = list(scalars)
+        self.scalar_calls = 0
+
+    async def execute(self, statement, params=None):
+        return FakeResult(self.rows)
+
+    async def scalar(self, statement):
+        self.scalar_calls += 1
+        return self.scalars.pop(0)
+
+
+STATUS_FILTER = [lambda s: s.where(Task.status == "todo")]
+
+
+async def _total(db, filters, limit=2, offset=0, include_total=True):
+    body = orjson.loads(await _fetch_task_page(db, filters, limit, offset, include_total))
+    return body["total"]
+
+
+async def test_total_is_null_unless_requested():
+    db = FakeSession([TaskRow(*_values(1))])
+    assert await _total(db, STATUS_FILTER, include_total=False) is None
+    assert await _total(db, [], include_total=False) is None
+    assert db.scalar_calls == 0
+
+
+async def test_filtered_total_comes_from_the_window_count():
+    db = FakeSession([CountedRow(*_values(1), 7), CountedRow(*_values(2), 7)])
+    body = orjson.loads(await _fetch_task_page(db, STATUS_FILTER, 2, 0, True))
+    assert body["total"] == 7
+    # The trailing window column is not serialized as a task field.
+    assert list(body["tasks"][0]) == list(_READ_FIELDS)
+    assert db.scalar_calls == 0
+
+
+async def test_filtered_page_past_the_end_counts_directly():
+    db = FakeSession([], scalars=[5])
+    assert await _total(db, STATUS_FILTER, offset=100) == 5
+    assert db.scalar_calls == 1
+
+
+async def test_filtered_empty_first_page_is_zero_without_a_count():
+    db = FakeSession([])
+    assert await _total(db, STATUS_FILTER) == 0
+    assert db.scalar_calls == 0
+
+
+async def test_unfiltered_total_uses_the_planner_estimate():
+    db = FakeSession([TaskRow(*_values(1))], scalars=[1000])
+    assert await _total(db, []) == 1000
+
+
+async def test_unfiltered_estimate_never_undercounts_the_page():
+    # Stale statistics: the estimate is below what this page proves exists.
+    db = FakeSession([TaskRow(*_values(11)), TaskRow(*_values(12))], scalars=[3])
+    assert await _total(db, [], offset=10) == 12
+
+
+async def test_unfiltered_falls_back_to_exact_count_before_first_analyze():
+    db = FakeSession([TaskRow(*_values(1))], scalars=[-1, 42])
+    assert await _total(db, []) == 42
+    assert db.scalar_calls == 2